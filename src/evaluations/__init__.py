@@ -0,0 +1 @@
+"""Metric computation helpers for evaluating trained models."""
@@ -0,0 +1,67 @@
+import numpy as np
+from numba import njit
+from numpy.typing import NDArray
+
+
+@njit(cache=True, fastmath=True)
+def _rank_auc_kernel(y_true: NDArray[np.int8], y_score: NDArray[np.float64]) -> float:
+    """Compute ROC AUC via the Mann–Whitney U statistic over score ranks.
+
+    Sorts the scores once, assigns average ranks to tied groups, then sums the
+    ranks of the positive class — no per-threshold bookkeeping.
+
+    Args:
+        y_true (NDArray[np.int8]): True binary labels of shape (n_samples,).
+        y_score (NDArray[np.float64]): Predicted scores of shape (n_samples,).
+
+    Returns:
+        float: ROC AUC, or NaN if only one class is present.
+    """
+    n = y_score.shape[0]
+    order = np.argsort(y_score)
+
+    # Average ranks across tied score groups
+    ranks = np.empty(n, dtype=np.float64)
+    i = 0
+    while i < n:
+        j = i
+        while j + 1 < n and y_score[order[j + 1]] == y_score[order[i]]:
+            j += 1
+        avg_rank = 0.5 * (i + j) + 1.0
+        for k in range(i, j + 1):
+            ranks[order[k]] = avg_rank
+        i = j + 1
+
+    n_pos = 0
+    pos_rank_sum = 0.0
+    for i in range(n):
+        if y_true[i]:
+            n_pos += 1
+            pos_rank_sum += ranks[i]
+
+    n_neg = n - n_pos
+    if n_pos == 0 or n_neg == 0:
+        return np.nan
+
+    return float((pos_rank_sum - n_pos * (n_pos + 1) / 2.0) / (n_pos * n_neg))
+
+
+def fast_auc(y_true: NDArray[np.float64], y_score: NDArray[np.float64]) -> float:
+    """Compute ROC AUC with the JIT-compiled rank-based kernel.
+
+    Drop-in replacement for ``sklearn.metrics.roc_auc_score`` on binary
+    labels; ties are handled with average ranks, matching sklearn's result.
+
+    Args:
+        y_true (NDArray[np.float64]): True binary labels of shape (n_samples,).
+        y_score (NDArray[np.float64]): Predicted scores or probabilities.
+
+    Returns:
+        float: ROC AUC score.
+    """
+    return float(
+        _rank_auc_kernel(
+            np.ascontiguousarray(y_true, dtype=np.int8),
+            np.ascontiguousarray(y_score, dtype=np.float64),
+        )
+    )
@@ -0,0 +1,36 @@
+import numpy as np
+from numpy.typing import NDArray
+
+
+def _confusion_metrics(
+    y_true: NDArray[np.float64], y_pred_bin: NDArray[np.bool_]
+) -> tuple[float, float, float, float]:
+    """Compute accuracy, precision, recall and F1-score in one pass over the labels.
+
+    Counts TP/FP/FN/TN once with boolean NumPy operations and derives all four
+    metrics arithmetically, instead of letting each sklearn scorer rebuild the
+    confusion matrix from scratch.
+
+    Args:
+        y_true (NDArray[np.float64]): True binary target values of shape (n_samples,).
+        y_pred_bin (NDArray[np.bool_]): Binarized predictions of shape (n_samples,).
+
+    Returns:
+        tuple[float, float, float, float]: Accuracy, precision, recall, and F1-score.
+    """
+    # copy=False skips the copy for already-bool input (the binarized predictions);
+    # float labels still get converted once
+    yb = np.asarray(y_true).astype(bool, copy=False)
+    pb = np.asarray(y_pred_bin).astype(bool, copy=False)
+
+    tp = np.count_nonzero(yb & pb)
+    fp = np.count_nonzero(~yb & pb)
+    fn = np.count_nonzero(yb & ~pb)
+    tn = len(yb) - tp - fp - fn
+
+    accuracy = (tp + tn) / len(yb)
+    precision = tp / (tp + fp) if tp + fp else 0.0
+    recall = tp / (tp + fn) if tp + fn else 0.0
+    f1 = 2 * tp / (2 * tp + fp + fn) if tp + fp + fn else 0.0
+
+    return accuracy, precision, recall, f1
@@ -1,13 +1,9 @@
 import numpy as np
 import pandas as pd
 from numpy.typing import NDArray
-from sklearn.metrics import (
-    accuracy_score,
-    f1_score,
-    precision_score,
-    recall_score,
-    roc_auc_score,
-)
+
+from evaluations._auc import fast_auc
+from evaluations._metrics import _confusion_metrics
 
 
 def evaluate_classification(
@@ -24,14 +20,16 @@ def evaluate_classification(
             Recall, F1-score, and ROC AUC. Rows correspond to the metric names.
     """
     # If predictions are probabilities, binarize with threshold 0.5
-    y_pred_bin = (y_pred > 0.5).astype(int)
+    y_pred_bin = y_pred > 0.5
+
+    accuracy, precision, recall, f1 = _confusion_metrics(y_true, y_pred_bin)
 
     metrics = {
-        "Accuracy": accuracy_score(y_true, y_pred_bin),
-        "Precision": precision_score(y_true, y_pred_bin),
-        "Recall": recall_score(y_true, y_pred_bin),
-        "F1-score": f1_score(y_true, y_pred_bin),
-        "ROC AUC": roc_auc_score(y_true, y_pred),
+        "Accuracy": accuracy,
+        "Precision": precision,
+        "Recall": recall,
+        "F1-score": f1,
+        "ROC AUC": fast_auc(y_true, y_pred),
     }
 
     return pd.DataFrame.from_dict(metrics, orient="index", columns=["score"]).T
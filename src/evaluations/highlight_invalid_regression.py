@@ -1,6 +1,20 @@
 import numpy as np
 import pandas as pd
 
+_GREEN = "background-color: green; color: white"
+_ORANGE = "background-color: orange; color: white"
+_RED = "background-color: red; color: white"
+
+# Metric name -> (threshold_low, threshold_high, direction)
+_RULES = {
+    "R²": (0.5, 0.8, "higher_better"),
+    "EVS": (0.5, 0.8, "higher_better"),
+    "MAPE": (0.1, 0.2, "lower_better"),
+    "SMAPE": (0.1, 0.2, "lower_better"),
+    "RMSLE": (0.1, 0.2, "lower_better"),
+    "WAPE": (0.1, 0.2, "lower_better"),
+}
+
 
 def highlight_invalid_regression_metrics(column: pd.Series) -> list[str]:
     """Returns a list of CSS styles to highlight regression metric values.
@@ -10,40 +24,28 @@ def highlight_invalid_regression_metrics(column: pd.Series) -> list[str]:
     - Orange: warning,
     - Red: poor values.
 
+    Thresholds come from the ``_RULES`` registry — one dict lookup per column —
+    and are applied as vectorized ``np.select`` masks over the whole column.
+
     Args:
         column (pd.Series): Metric values.
 
     Returns:
         list[str]: CSS styles for each cell in the column.
     """
-    metric = column.name
-    highlight_styles = []
-    for val in column:
-        if not isinstance(val, float) or np.isnan(val):
-            highlight_styles.append("")
-            continue
-
-        # R² / EVS
-        if metric in {"R²", "EVS"}:
-            if val < 0.5:
-                style = "background-color: red; color: white"
-            elif val <= 0.8:
-                style = "background-color: orange; color: white"
-            else:
-                style = "background-color: green; color: white"
-
-        # MAPE / SMAPE / WAPE / RMSLE
-        elif metric in {"MAPE", "SMAPE", "RMSLE", "WAPE"}:
-            if val > 0.2:
-                style = "background-color: red; color: white"
-            elif val >= 0.1:
-                style = "background-color: orange; color: white"
-            else:
-                style = "background-color: green; color: white"
-
-        else:
-            style = ""
-
-        highlight_styles.append(style)
-
-    return highlight_styles
+    rule = _RULES.get(str(column.name))
+    if rule is None:
+        return [""] * len(column)
+
+    low, high, direction = rule
+    vals = pd.to_numeric(column, errors="coerce").to_numpy(dtype=float)
+
+    if direction == "higher_better":
+        conditions = [np.isnan(vals), vals < low, vals <= high]
+    else:
+        conditions = [np.isnan(vals), vals > high, vals >= low]
+
+    styles: list[str] = np.select(
+        conditions, ["", _RED, _ORANGE], default=_GREEN
+    ).tolist()
+    return styles
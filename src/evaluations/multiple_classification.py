@@ -1,19 +1,49 @@
+from typing import Any
+
 import numpy as np
 import pandas as pd
+from joblib import Memory, Parallel, delayed
 from numpy.typing import NDArray
-from sklearn.metrics import (
-    accuracy_score,
-    f1_score,
-    precision_score,
-    recall_score,
-    roc_auc_score,
-)
 
+from evaluations._auc import fast_auc
 
-def evaluate_classification_models(
+_METRIC_NAMES = ["Accuracy", "Precision", "Recall", "F1-score", "ROC AUC"]
+
+# Content-hashed on-disk cache: identical (predictions, y) pairs survive
+# kernel restarts, the usual notebook re-run pattern
+_memory = Memory(location=".cache/evals", verbose=0)
+
+
+def _rank_auc_device(yb: Any, scores: Any, xp: Any) -> float:
+    """Compute ROC AUC on-device via average ranks from the Mann–Whitney U formula.
+
+    Args:
+        yb (Any): Boolean label array living on the device.
+        scores (Any): Predicted score array living on the device.
+        xp (Any): Array module (``cupy``) providing the NumPy API.
+
+    Returns:
+        float: ROC AUC, or NaN if only one class is present.
+    """
+    _, inverse, counts = xp.unique(scores, return_inverse=True, return_counts=True)
+    ranks = (xp.cumsum(counts) - (counts - 1) / 2.0)[inverse]
+
+    n_pos = int(xp.count_nonzero(yb))
+    n_neg = int(yb.size) - n_pos
+    if n_pos == 0 or n_neg == 0:
+        return float("nan")
+
+    pos_rank_sum = float(ranks[yb].sum())
+    return (pos_rank_sum - n_pos * (n_pos + 1) / 2.0) / (n_pos * n_neg)
+
+
+def _evaluate_on_cuda(
     predictions: dict[str, NDArray[np.float64]], y: NDArray[np.float64]
 ) -> pd.DataFrame:
-    """Evaluate multiple classification model predictions on the provided dataset.
+    """Evaluate classification models on the GPU via CuPy.
+
+    Ships the labels to the GPU once, reduces each model's predictions there,
+    and transfers only the five scalar metrics back to the host.
 
     Args:
         predictions (dict[str, NDArray[np.float64]]): Dictionary mapping model names
@@ -21,23 +51,205 @@ def evaluate_classification_models(
         y (NDArray[np.float64]): True binary target values of shape (n_samples,).
 
     Returns:
-        pd.DataFrame: DataFrame containing classification metrics — Accuracy, Precision,
-            Recall, F1-score, and ROC AUC — for each model. Columns correspond to
-            model names, rows correspond to the metric names.
+        pd.DataFrame: Same layout as :func:`evaluate_classification_models`.
+
+    Raises:
+        ImportError: If CuPy is not installed.
+    """
+    try:
+        import cupy as cp  # type: ignore[import-not-found]  # noqa: PLC0415
+    except ImportError as exc:
+        raise ImportError("device='cuda' requires the cupy package") from exc
+
+    yb = cp.asarray(y).astype(cp.bool_)
+    n = int(yb.size)
+
+    # One comparison buffer reused across models instead of a fresh one each loop
+    pb = cp.empty(yb.shape, dtype=cp.bool_)
+
+    results = {}
+    for name, y_pred in predictions.items():
+        p_g = cp.asarray(y_pred)
+        cp.greater(p_g, 0.5, out=pb)
+
+        tp = int(cp.count_nonzero(yb & pb))
+        fp = int(cp.count_nonzero(~yb & pb))
+        fn = int(cp.count_nonzero(yb & ~pb))
+        tn = n - tp - fp - fn
+
+        accuracy = (tp + tn) / n
+        precision = tp / (tp + fp) if tp + fp else 0.0
+        recall = tp / (tp + fn) if tp + fn else 0.0
+        f1 = 2 * tp / (2 * tp + fp + fn) if tp + fp + fn else 0.0
+        roc_auc = _rank_auc_device(yb, p_g, cp)
+
+        results[name] = np.array([accuracy, precision, recall, f1, roc_auc])
+
+    return pd.DataFrame(results, index=_METRIC_NAMES)
+
+
+def _score_batched(
+    pred_matrix: NDArray[np.float64], y: NDArray[np.float64]
+) -> dict[str, NDArray[np.float64]]:
+    """Score all models at once from a stacked (n_models, n_samples) matrix.
+
+    Computes every model's TP/FP/FN/TN with one vectorized reduction along
+    the sample axis instead of K sequential per-model passes; only ROC AUC
+    still runs per model (threaded), since it needs a per-row argsort.
+
+    Args:
+        pred_matrix (NDArray[np.float64]): Stacked predictions, one row per model.
+        y (NDArray[np.float64]): True binary target values of shape (n_samples,).
+
+    Returns:
+        dict[str, NDArray[np.float64]]: Mapping from metric name to an array of
+            per-model values.
     """
-    evaluations = pd.DataFrame(
-        columns=predictions.keys(),
-        index=["Accuracy", "Precision", "Recall", "F1-score", "ROC AUC"],
+    pb = pred_matrix > 0.5
+    yb = y.astype(bool)[None, :]
+    n = y.size
+
+    tp = (pb & yb).sum(axis=1).astype(np.float64)
+    fp = (pb & ~yb).sum(axis=1).astype(np.float64)
+    fn = (~pb & yb).sum(axis=1).astype(np.float64)
+    tn = n - tp - fp - fn
+
+    accuracy = (tp + tn) / n
+    precision = np.where(tp + fp > 0, tp / np.maximum(tp + fp, 1), 0.0)
+    recall = np.where(tp + fn > 0, tp / np.maximum(tp + fn, 1), 0.0)
+    f1 = np.where(tp + fp + fn > 0, 2 * tp / np.maximum(2 * tp + fp + fn, 1), 0.0)
+    roc_auc = np.array(
+        Parallel(n_jobs=-1, prefer="threads")(
+            delayed(fast_auc)(y, row) for row in pred_matrix
+        )
     )
 
+    return {
+        "Accuracy": accuracy,
+        "Precision": precision,
+        "Recall": recall,
+        "F1-score": f1,
+        "ROC AUC": roc_auc,
+    }
+
+
+def _score_models(
+    predictions: dict[str, NDArray[np.float64]], y: NDArray[np.float64]
+) -> dict[str, NDArray[np.float64]]:
+    """Score every model in ``predictions`` from one stacked matrix.
+
+    Args:
+        predictions (dict[str, NDArray[np.float64]]): Dictionary mapping model names
+            to predicted target arrays for the dataset.
+        y (NDArray[np.float64]): True binary target values of shape (n_samples,).
+
+    Returns:
+        dict[str, NDArray[np.float64]]: Mapping from metric name to an array of
+            per-model values, ordered like ``predictions``.
+
+    Raises:
+        ValueError: If any prediction array does not match the shape of ``y``.
+    """
     for name, y_pred in predictions.items():
-        y_pred_bin = y_pred > 0.5
-        accuracy = accuracy_score(y, y_pred_bin)
-        precision = precision_score(y, y_pred_bin)
-        recall = recall_score(y, y_pred_bin)
-        f1 = f1_score(y, y_pred_bin)
-        roc_auc = roc_auc_score(y, y_pred)
+        if y_pred.shape != y.shape:
+            raise ValueError(
+                f"Predictions for {name!r} have shape {y_pred.shape}, "
+                f"expected {y.shape} to match y"
+            )
+
+    # Names are only needed at DataFrame assembly — score positionally
+    return _score_batched(np.stack(list(predictions.values())), y)
 
-        evaluations.loc[:, name] = [accuracy, precision, recall, f1, roc_auc]
 
-    return evaluations.astype(float)
+def _score_models_named(
+    names: tuple[str, ...],
+    arrs: tuple[NDArray[np.float64], ...],
+    y: NDArray[np.float64],
+) -> dict[str, NDArray[np.float64]]:
+    """Score models from parallel name/array tuples, for the disk cache.
+
+    joblib's ``Memory`` hashes dict arguments order-insensitively, so caching
+    on the predictions dict directly would let a reordered dict hit an entry
+    whose rows follow the old order. Tuples hash order-sensitively, making the
+    model order part of the cache key.
+
+    Args:
+        names (tuple[str, ...]): Model names, in prediction order.
+        arrs (tuple[NDArray[np.float64], ...]): Prediction arrays, one per name.
+        y (NDArray[np.float64]): True binary target values of shape (n_samples,).
+
+    Returns:
+        dict[str, NDArray[np.float64]]: Mapping from metric name to an array of
+            per-model values, ordered like ``names``.
+    """
+    return _score_models(dict(zip(names, arrs, strict=True)), y)
+
+
+_score_models_cached = _memory.cache(_score_models_named)
+
+
+def evaluate_classification_models_fast(
+    predictions: dict[str, NDArray[np.float64]],
+    y: NDArray[np.float64],
+    use_cache: bool = True,
+) -> dict[str, NDArray[np.float64]]:
+    """Evaluate classification models without building a pandas DataFrame.
+
+    For tiny K×5 result tables the DataFrame construction costs more than the
+    metric math, so callers that aggregate results programmatically can use
+    this dict-of-arrays form directly. When all prediction arrays match the
+    shape of ``y``, they are stacked into one (n_models, n_samples) matrix and
+    reduced in a single vectorized pass.
+
+    Args:
+        predictions (dict[str, NDArray[np.float64]]): Dictionary mapping model names
+            to predicted target arrays for the dataset.
+        y (NDArray[np.float64]): True binary target values of shape (n_samples,).
+        use_cache (bool, optional): Memoize results on disk under
+            ``.cache/evals``, keyed on the array contents. Default is True.
+
+    Returns:
+        dict[str, NDArray[np.float64]]: Mapping from metric name to an array of
+            per-model values, ordered like ``predictions``.
+    """
+    if use_cache:
+        result: dict[str, NDArray[np.float64]] = _score_models_cached(
+            tuple(predictions), tuple(predictions.values()), y
+        )
+        return result
+
+    return _score_models(predictions, y)
+
+
+def evaluate_classification_models(
+    predictions: dict[str, NDArray[np.float64]],
+    y: NDArray[np.float64],
+    device: str = "cpu",
+    use_cache: bool = True,
+) -> pd.DataFrame:
+    """Evaluate multiple classification model predictions on the provided dataset.
+
+    Args:
+        predictions (dict[str, NDArray[np.float64]]): Dictionary mapping model names
+            to predicted target arrays for the dataset.
+        y (NDArray[np.float64]): True binary target values of shape (n_samples,).
+        device (str, optional): "cpu" (default) scores with threaded NumPy kernels;
+            "cuda" offloads the reductions to the GPU via CuPy, which pays off on
+            multi-million-row hold-outs.
+        use_cache (bool, optional): Memoize CPU results on disk under
+            ``.cache/evals``, keyed on the array contents. Default is True.
+
+    Returns:
+        pd.DataFrame: DataFrame containing classification metrics — Accuracy, Precision,
+            Recall, F1-score, and ROC AUC — for each model. Columns correspond to
+            model names, rows correspond to the metric names.
+    """
+    if device == "cuda":
+        return _evaluate_on_cuda(predictions, y)
+
+    scores = evaluate_classification_models_fast(predictions, y, use_cache=use_cache)
+    return pd.DataFrame(
+        np.array(list(scores.values())),
+        index=_METRIC_NAMES,
+        columns=list(predictions),
+    )
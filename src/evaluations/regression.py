@@ -1,17 +1,182 @@
 import numpy as np
 import pandas as pd
+from joblib import Memory, Parallel, delayed
+from numba import njit, prange
 from numpy.typing import NDArray
-from sklearn.metrics import (
-    explained_variance_score,
-    mean_absolute_error,
-    mean_squared_error,
-    r2_score,
-    root_mean_squared_error,
-)
 
+# Content-hashed on-disk cache: identical (predictions, y) pairs survive
+# kernel restarts, the usual notebook re-run pattern
+_memory = Memory(location=".cache/evals", verbose=0)
 
-def evaluate_regression_models(
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _residual_sums(
+    y: NDArray[np.float64], y_pred: NDArray[np.float64]
+) -> tuple[float, float, float]:
+    """Accumulate the residual sums needed by every regression metric.
+
+    One explicit SIMD-friendly loop over the residuals, parallelized with
+    ``prange``, with no temporary arrays.
+
+    Args:
+        y (NDArray[np.float64]): True target values of shape (n_samples,).
+        y_pred (NDArray[np.float64]): Predicted target values of shape (n_samples,).
+
+    Returns:
+        tuple[float, float, float]: Sums of |residual|, residual² and residual.
+    """
+    abs_sum = 0.0
+    sq_sum = 0.0
+    res_sum = 0.0
+    # numba ships no stubs, so prange is opaque to mypy
+    for i in prange(y.shape[0]):  # type: ignore[no-untyped-call, attr-defined]
+        res = y[i] - y_pred[i]
+        abs_sum += abs(res)
+        sq_sum += res * res
+        res_sum += res
+
+    return abs_sum, sq_sum, res_sum
+
+
+def _regression_metrics(
+    y: NDArray[np.float64],
+    y_pred: NDArray[np.float64],
+    ss_tot: float,
+    y_var: float,
+) -> NDArray[np.float64]:
+    """Compute MAE, MSE, RMSE, R² and EVS from a single residual pass.
+
+    Computes the residuals once and derives all five metrics from them,
+    instead of letting each sklearn scorer traverse ``y - y_pred`` on its own.
+    The reductions over ``y`` alone are invariant across models, so the caller
+    computes them once and passes them in.
+
+    Args:
+        y (NDArray[np.float64]): True target values of shape (n_samples,).
+        y_pred (NDArray[np.float64]): Predicted target values of shape (n_samples,).
+        ss_tot (float): Precomputed total sum of squares, ``((y - y.mean())**2).sum()``.
+        y_var (float): Precomputed variance of ``y``.
+
+    Returns:
+        NDArray[np.float64]: MAE, MSE, RMSE, R², and EVS values.
+    """
+    abs_sum, sq_sum, res_sum = _residual_sums(
+        np.ascontiguousarray(y, dtype=np.float64),
+        np.ascontiguousarray(y_pred, dtype=np.float64),
+    )
+    n = y.size
+
+    mae = abs_sum / n
+    mse = sq_sum / n
+    rmse = float(np.sqrt(mse))
+
+    r2 = 1.0 - sq_sum / ss_tot
+    res_var = mse - (res_sum / n) ** 2
+    evs = 1.0 - res_var / y_var
+
+    return np.array([mae, mse, rmse, r2, evs])
+
+
+_METRIC_NAMES = ["MAE", "MSE", "RMSE", "R²", "EVS"]
+
+
+def _score_models(
     predictions: dict[str, NDArray[np.float64]], y: NDArray[np.float64]
+) -> dict[str, NDArray[np.float64]]:
+    """Score every model in ``predictions`` against the true targets.
+
+    Args:
+        predictions (dict[str, NDArray[np.float64]]): Dictionary where keys are
+            model names and values are predicted target arrays corresponding to X.
+        y (NDArray[np.float64]): True target values of shape (n_samples,).
+
+    Returns:
+        dict[str, NDArray[np.float64]]: Mapping from metric name to an array of
+            per-model values, ordered like ``predictions``.
+    """
+    # Reductions over y are the same for every model — compute them once
+    y_mean = float(y.mean())
+    ss_tot = float(((y - y_mean) ** 2).sum())
+    y_var = ss_tot / y.size
+
+    # Names are only needed at DataFrame assembly — score positionally
+    arrs = list(predictions.values())
+
+    # Threads suffice here: the metric kernels release the GIL in NumPy loops
+    rows = Parallel(n_jobs=-1, prefer="threads")(
+        delayed(_regression_metrics)(y, y_pred, ss_tot, y_var) for y_pred in arrs
+    )
+
+    # Preallocated float64 block — no object dtype, no astype copy downstream
+    scores = np.empty((len(rows), len(_METRIC_NAMES)), dtype=np.float64)
+    for i, row in enumerate(rows):
+        scores[i] = row
+
+    return {metric: scores[:, i] for i, metric in enumerate(_METRIC_NAMES)}
+
+
+def _score_models_named(
+    names: tuple[str, ...],
+    arrs: tuple[NDArray[np.float64], ...],
+    y: NDArray[np.float64],
+) -> dict[str, NDArray[np.float64]]:
+    """Score models from parallel name/array tuples, for the disk cache.
+
+    joblib's ``Memory`` hashes dict arguments order-insensitively, so caching
+    on the predictions dict directly would let a reordered dict hit an entry
+    whose rows follow the old order. Tuples hash order-sensitively, making the
+    model order part of the cache key.
+
+    Args:
+        names (tuple[str, ...]): Model names, in prediction order.
+        arrs (tuple[NDArray[np.float64], ...]): Prediction arrays, one per name.
+        y (NDArray[np.float64]): True target values of shape (n_samples,).
+
+    Returns:
+        dict[str, NDArray[np.float64]]: Mapping from metric name to an array of
+            per-model values, ordered like ``names``.
+    """
+    return _score_models(dict(zip(names, arrs, strict=True)), y)
+
+
+_score_models_cached = _memory.cache(_score_models_named)
+
+
+def evaluate_regression_models_fast(
+    predictions: dict[str, NDArray[np.float64]],
+    y: NDArray[np.float64],
+    use_cache: bool = True,
+) -> dict[str, NDArray[np.float64]]:
+    """Evaluate regression models without building a pandas DataFrame.
+
+    For tiny K×5 result tables the DataFrame construction costs more than the
+    metric math, so callers that aggregate results programmatically can use
+    this dict-of-arrays form directly.
+
+    Args:
+        predictions (dict[str, NDArray[np.float64]]): Dictionary where keys are
+            model names and values are predicted target arrays corresponding to X.
+        y (NDArray[np.float64]): True target values of shape (n_samples,).
+        use_cache (bool, optional): Memoize results on disk under
+            ``.cache/evals``, keyed on the array contents. Default is True.
+
+    Returns:
+        dict[str, NDArray[np.float64]]: Mapping from metric name to an array of
+            per-model values, ordered like ``predictions``.
+    """
+    if use_cache:
+        result: dict[str, NDArray[np.float64]] = _score_models_cached(
+            tuple(predictions), tuple(predictions.values()), y
+        )
+        return result
+
+    return _score_models(predictions, y)
+
+
+def evaluate_regression_models(
+    predictions: dict[str, NDArray[np.float64]],
+    y: NDArray[np.float64],
+    use_cache: bool = True,
 ) -> pd.DataFrame:
     """Evaluate multiple regression model predictions on the given dataset.
 
@@ -19,24 +184,16 @@ def evaluate_regression_models(
         predictions (dict[str, NDArray[np.float64]]): Dictionary where keys are
             model names and values are predicted target arrays corresponding to X.
         y (NDArray[np.float64]): True target values of shape (n_samples,).
+        use_cache (bool, optional): Memoize results on disk under
+            ``.cache/evals``, keyed on the array contents. Default is True.
 
     Returns:
         pd.DataFrame: DataFrame with evaluation metrics (MAE, MSE, RMSE, R², EVS) for
             each model. Columns correspond to model names; rows correspond to metrics.
     """
-    evaluations = pd.DataFrame(
-        columns=predictions.keys(), index=["MAE", "MSE", "RMSE", "R²", "EVS"]
+    scores = evaluate_regression_models_fast(predictions, y, use_cache=use_cache)
+    return pd.DataFrame(
+        np.array(list(scores.values())),
+        index=_METRIC_NAMES,
+        columns=list(predictions),
     )
-
-    for name, y_pred in predictions.items():
-        metrics = {
-            "MAE": mean_absolute_error(y, y_pred),
-            "MSE": mean_squared_error(y, y_pred),
-            "RMSE": root_mean_squared_error(y, y_pred),
-            "R²": r2_score(y, y_pred),
-            "EVS": explained_variance_score(y, y_pred),
-        }
-
-        evaluations.loc[:, name] = metrics
-
-    return evaluations.astype(float)
@@ -0,0 +1 @@
+"""Plotting helpers for visualizing models and their predictions."""
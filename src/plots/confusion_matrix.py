@@ -2,7 +2,6 @@ import matplotlib.pyplot as plt
 import numpy as np
 import seaborn as sns
 from numpy.typing import NDArray
-from sklearn.metrics import confusion_matrix
 
 
 def plot_confusion_matrix(y_true: NDArray[np.int64], y_pred: NDArray[np.int64]) -> None:
@@ -12,6 +11,9 @@ def plot_confusion_matrix(y_true: NDArray[np.int64], y_pred: NDArray[np.int64])
         y_true (NDArray[np.int64]): True labels.
         y_pred (NDArray[np.int64]): Predicted labels.
     """
+    # Deferred so importing the module doesn't pay the sklearn import cost
+    from sklearn.metrics import confusion_matrix  # noqa: PLC0415
+
     conf_matrix = confusion_matrix(y_true, y_pred)
 
     sns.heatmap(
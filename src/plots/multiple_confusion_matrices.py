@@ -2,9 +2,7 @@ from math import ceil
 
 import matplotlib.pyplot as plt
 import numpy as np
-import seaborn as sns
 from numpy.typing import NDArray
-from sklearn.metrics import confusion_matrix
 
 
 def plot_confusion_matrices(
@@ -15,7 +13,9 @@ def plot_confusion_matrices(
     """Plot confusion matrices for multiple classification models.
 
     Each confusion matrix compares the true labels to predictions from one model.
-    The plots are arranged in a grid layout for easy comparison.
+    The plots are arranged in a grid layout for easy comparison. The grid is
+    built once with ``subplot_mosaic`` and cells are rendered directly with
+    ``imshow`` and ``text``, skipping seaborn's per-call heatmap overhead.
 
     Args:
         predictions (dict[str, NDArray[np.int64]]): A dictionary mapping model names to
@@ -24,21 +24,36 @@ def plot_confusion_matrices(
         n_cols (int, optional): Number of columns in the subplot grid layout.
             Default is 2.
     """
-    n_models = len(predictions)
+    # Deferred so importing the module doesn't pay the sklearn import cost
+    from sklearn.metrics import confusion_matrix  # noqa: PLC0415
+
+    names = list(predictions)
+    n_models = len(names)
     n_cols = min(n_models, n_cols)
     n_rows = ceil(n_models / n_cols)
-    fig, axes = plt.subplots(n_rows, n_cols, figsize=(6 * n_cols, 5 * n_rows))
-    axes = np.array(axes).reshape(-1)
 
-    for ax, (name, y_pred) in zip(axes, predictions.items(), strict=False):
-        conf_matrix = confusion_matrix(y_true, y_pred)
-        sns.heatmap(conf_matrix, annot=True, fmt="d", cmap="Blues", cbar=False, ax=ax)
+    # "." marks unused grid cells, so no axes need deleting afterwards
+    mosaic = [
+        [names[i] if i < n_models else "." for i in range(r * n_cols, (r + 1) * n_cols)]
+        for r in range(n_rows)
+    ]
+    _fig, axes = plt.subplot_mosaic(mosaic, figsize=(6 * n_cols, 5 * n_rows))
+
+    for name in names:
+        ax = axes[name]
+        conf_matrix = confusion_matrix(y_true, predictions[name])
+        ax.imshow(conf_matrix, cmap="Blues")
+
+        threshold = conf_matrix.max() / 2
+        for (i, j), value in np.ndenumerate(conf_matrix):
+            color = "white" if value > threshold else "black"
+            ax.text(j, i, str(value), ha="center", va="center", color=color)
+
+        ax.set_xticks(range(conf_matrix.shape[1]))
+        ax.set_yticks(range(conf_matrix.shape[0]))
         ax.set_xlabel("Predicted Labels")
         ax.set_ylabel("True Labels")
         ax.set_title(name)
 
-    for i in range(n_models, len(axes)):
-        fig.delaxes(axes[i])
-
     plt.tight_layout()
     plt.show()
@@ -2,7 +2,6 @@ import matplotlib.pyplot as plt
 import numpy as np
 import seaborn as sns
 from numpy.typing import NDArray
-from sklearn.metrics import auc, average_precision_score, precision_recall_curve
 
 
 def plot_precision_recall_curve(
@@ -14,6 +13,13 @@ def plot_precision_recall_curve(
         y_true (NDArray[np.int64]): True binary class labels.
         y_probs (NDArray[np.float64]): Predicted probabilities for the positive class.
     """
+    # Deferred so importing the module doesn't pay the sklearn import cost
+    from sklearn.metrics import (  # noqa: PLC0415
+        auc,
+        average_precision_score,
+        precision_recall_curve,
+    )
+
     precision, recall, _ = precision_recall_curve(y_true, y_probs)
     ap = average_precision_score(y_true, y_probs)
     pr_auc = auc(recall, precision)
@@ -2,7 +2,6 @@ import matplotlib.pyplot as plt
 import numpy as np
 import seaborn as sns
 from numpy.typing import NDArray
-from sklearn.metrics import roc_auc_score, roc_curve
 
 
 def plot_roc_curve(y_true: NDArray[np.int64], y_probs: NDArray[np.int64]) -> None:
@@ -12,6 +11,9 @@ def plot_roc_curve(y_true: NDArray[np.int64], y_probs: NDArray[np.int64]) -> Non
         y_true (NDArray[np.int64]): True binary class labels.
         y_probs (NDArray[np.float64]): Predicted probabilities for the positive class.
     """
+    # Deferred so importing the module doesn't pay the sklearn import cost
+    from sklearn.metrics import roc_auc_score, roc_curve  # noqa: PLC0415
+
     fpr, tpr, _ = roc_curve(y_true, y_probs)
     auc = roc_auc_score(y_true, y_probs)
 